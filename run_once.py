@@ -28,7 +28,7 @@ else:
 
 async def main(group_id: int) -> None:
     config = get_config()
-    configure_logging(config.log_level)
+    configure_logging(config.log_level, config.log_format)
 
     result = await parse_group(group_id)
     status = "SUCCESS" if result.status else "FAILURE"
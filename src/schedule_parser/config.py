@@ -37,10 +37,12 @@ class Config:
     
     # Парсинг
     max_concurrent_parses: int = 5
+    parse_workers: Optional[int] = None  # None - по числу CPU
     user_agent: str = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
     
     # Логирование
     log_level: str = "INFO"
+    log_format: str = "console"  # console, json или auto (json, если вывод не в терминал)
     
     @classmethod
     def from_env(cls) -> "Config":
@@ -52,6 +54,8 @@ class Config:
         database_url = os.getenv("DATABASE_URL")
         if not database_url:
             raise ValueError("DATABASE_URL environment variable is required")
+
+        parse_workers = os.getenv("PARSE_WORKERS")
         
         return cls(
             database_url=database_url,
@@ -60,8 +64,10 @@ class Config:
             retry_delay=float(os.getenv("RETRY_DELAY", "1.0")),
             retry_exponential_base=float(os.getenv("RETRY_EXPONENTIAL_BASE", "2.0")),
             max_concurrent_parses=int(os.getenv("MAX_CONCURRENT_PARSES", "5")),
+            parse_workers=int(parse_workers) if parse_workers else None,
             user_agent=os.getenv("USER_AGENT", "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"),
             log_level=os.getenv("LOG_LEVEL", "INFO"),
+            log_format=os.getenv("LOG_FORMAT", "console"),
         )
 
 
@@ -236,6 +236,8 @@ class Database:
                 )
                 for lesson in lessons
             ]
+            # Транспонируем записи в столбцы для UNNEST за один проход
+            columns = [list(column) for column in zip(*records)]
 
             result = await connection.fetch(
                 """
@@ -251,19 +253,7 @@ class Database:
                 )
                 RETURNING LessonId
                 """,
-                [r[0] for r in records],   # group_id
-                [r[1] for r in records],   # name
-                [r[2] for r in records],   # lesson_date
-                [r[3] for r in records],   # day_of_week
-                [r[4] for r in records],   # lesson_number
-                [r[5] for r in records],   # start_time
-                [r[6] for r in records],   # end_time
-                [r[7] for r in records],   # teacher_name
-                [r[8] for r in records],   # cabinet_number
-                [r[9] for r in records],   # week_type
-                [r[10] for r in records],  # lesson_type
-                [r[11] for r in records],  # subgroup
-                [r[12] for r in records],  # raw_text
+                *columns
             )
             return [row['lessonid'] for row in result]
 
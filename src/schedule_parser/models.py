@@ -21,7 +21,7 @@ class ChangeType(str, Enum):
     DELETE = "delete"
 
 
-@dataclass
+@dataclass(slots=True)
 class Lesson:
     """
     Модель урока.
@@ -61,24 +61,44 @@ class Lesson:
     date_added: Optional[datetime] = None
     last_updated: Optional[datetime] = None
 
+    @property
+    def key(self) -> int:
+        """
+        Ключ позиции урока в расписании недели: (день, пара, подгруппа).
+
+        Упакован в одно целое число, чтобы не создавать кортеж на каждый урок
+        при сопоставлении старого и нового расписания. Подгруппа хранится со
+        сдвигом на единицу, чтобы "без подгруппы" (None) не совпадало с 0.
+        """
+        subgroup = 0 if self.subgroup is None else self.subgroup + 1
+        return self.day_of_week << 20 | self.lesson_number << 8 | subgroup
+
+    @property
+    def compare_key(self) -> tuple:
+        """
+        Кортеж ключевых полей, которые могут меняться в расписании.
+
+        Не включает lesson_id, даты добавления/обновления и raw_text.
+        """
+        return (
+            self.name,
+            self.teacher_name,
+            self.cabinet_number,
+            self.lesson_type,
+            self.start_time,
+            self.end_time,
+            self.subgroup,
+        )
+
     def __eq__(self, other) -> bool:
         """
         Сравнение уроков для определения изменений.
 
-        Сравниваем ключевые поля, которые могут меняться в расписании.
-        Не сравниваем lesson_id, даты добавления/обновления и raw_text.
+        Сравниваем ключевые поля (см. compare_key).
         """
         if not isinstance(other, Lesson):
             return False
-        return (
-            self.name == other.name
-            and self.teacher_name == other.teacher_name
-            and self.cabinet_number == other.cabinet_number
-            and self.lesson_type == other.lesson_type
-            and self.start_time == other.start_time
-            and self.end_time == other.end_time
-            and self.subgroup == other.subgroup
-        )
+        return self.compare_key == other.compare_key
 
     def __repr__(self) -> str:
         """Строковое представление урока для отладки."""
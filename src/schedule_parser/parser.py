@@ -4,9 +4,15 @@
 """
 
 import asyncio
+import logging
+import multiprocessing
+import re
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from datetime import date, datetime, timedelta
 from time import perf_counter
-from typing import Optional
+from typing import Iterator, Optional
 from html.parser import HTMLParser
 
 import aiohttp
@@ -15,48 +21,101 @@ import structlog
 from .models import Lesson, ParseResult, WeekType, ChangeType
 from .db import get_database, Database
 from .utils import (
-    DAY_MAPPING,
-    LESSON_TIMES,
-    parse_lesson_info,
+    LESSON_TIMES_ARR,
+    LessonInfo,
+    parse_lesson_info_batch,
+    get_day_of_week,
     get_monday_of_week,
     get_week_type_for_date,
     retry_async,
-    normalize_text
+    normalize_text,
+    is_log_enabled,
+    configure_logging
 )
 from .config import get_config
 
 logger = structlog.get_logger()
 
+# Кодировка страниц расписания (указана в мета-теге)
+SCHEDULE_ENCODING = "windows-1251"
+
+# Пул процессов для разбора HTML (CPU-bound, не отпускает GIL)
+_parse_pool: Optional[ProcessPoolExecutor] = None
+
+
+def get_parse_pool() -> ProcessPoolExecutor:
+    """
+    Получить общий пул процессов для разбора HTML.
+
+    Воркеры запускаются через spawn: fork из процесса с event loop и
+    потоками исполнителей может унаследовать захваченные блокировки.
+    В каждом воркере логирование настраивается так же, как в родителе.
+
+    Returns:
+        Экземпляр ProcessPoolExecutor, создаваемый при первом обращении
+    """
+    global _parse_pool
+
+    if _parse_pool is None:
+        config = get_config()
+        _parse_pool = ProcessPoolExecutor(
+            max_workers=config.parse_workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=configure_logging,
+            initargs=(config.log_level, config.log_format)
+        )
+
+    return _parse_pool
+
+
+def reset_parse_pool(pool: ProcessPoolExecutor) -> None:
+    """
+    Сбросить сломанный пул, чтобы следующий вызов создал новый.
+
+    Args:
+        pool: Пул, на котором произошла ошибка
+    """
+    global _parse_pool
+
+    # Пул мог быть уже пересоздан параллельной задачей
+    if _parse_pool is pool:
+        _parse_pool = None
+    pool.shutdown(wait=False, cancel_futures=True)
+
 
 class ScheduleHTMLParser(HTMLParser):
     """Парсер HTML-таблицы расписания."""
 
-    def __init__(self):
+    def __init__(self) -> None:
         """Инициализация парсера."""
         super().__init__()
         self.in_table = False
         self.in_row = False
         self.in_cell = False
-        self.current_row = []
-        self.current_row_flags: list[dict[str, bool]] = []
-        self.rows = []
+        self.current_row: list[str] = []
+        # Есть ли в текущей строке ячейка с синей подсветкой
+        self.row_has_blue = False
+        self.rows: list[list[str]] = []
         self.row_metadata: list[dict[str, bool]] = []
-        self.cell_data = []
+        self.cell_data: list[str] = []
+        # Пока в ячейке не встретилось ничего, кроме пробельных символов
+        self.cell_empty = True
         self.cell_has_blue = False
         self.group_name: Optional[str] = None
 
     def handle_starttag(self, tag: str, attrs: list) -> None:
-        """Обработка открывающего тега."""
-        match tag.lower():
+        """Обработка открывающего тега (HTMLParser передаёт имя в нижнем регистре)."""
+        match tag:
             case "table":
                 self.in_table = True
             case "tr" if self.in_table:
                 self.in_row = True
                 self.current_row = []
-                self.current_row_flags = []
+                self.row_has_blue = False
             case "td" if self.in_row:
                 self.in_cell = True
                 self.cell_data = []
+                self.cell_empty = True
                 self.cell_has_blue = False
             case "font":
                 # Извлекаем название группы из цветного шрифта
@@ -69,30 +128,32 @@ class ScheduleHTMLParser(HTMLParser):
                             self.cell_has_blue = True
 
     def handle_endtag(self, tag: str) -> None:
-        """Обработка закрывающего тега."""
-        match tag.lower():
+        """Обработка закрывающего тега (HTMLParser передаёт имя в нижнем регистре)."""
+        match tag:
             case "table":
                 self.in_table = False
             case "tr" if self.in_row:
                 self.in_row = False
                 if self.current_row:
-                    row_flag = {
-                        "has_blue": any(flag.get("has_blue", False) for flag in self.current_row_flags)
-                    }
                     self.rows.append(self.current_row)
-                    self.row_metadata.append(row_flag)
+                    self.row_metadata.append({"has_blue": self.row_has_blue})
             case "td" | "font" if self.in_cell:
                 self.in_cell = False
-                cell_text = ''.join(self.cell_data).strip()
+                # Большинство ячеек пустые - не собираем и не обрезаем их текст
+                cell_text = "" if self.cell_empty else ''.join(self.cell_data).strip()
                 self.current_row.append(cell_text)
-                self.current_row_flags.append({"has_blue": self.cell_has_blue})
+                if self.cell_has_blue:
+                    self.row_has_blue = True
                 self.cell_data = []
+                self.cell_empty = True
                 self.cell_has_blue = False
 
     def handle_data(self, data: str) -> None:
         """Обработка текстовых данных."""
         if self.in_cell:
             self.cell_data.append(data)
+            if self.cell_empty and data and not data.isspace():
+                self.cell_empty = False
         elif not self.group_name and "учебной группы:" in data:
             # Следующий текст после этой фразы - название группы
             pass
@@ -113,22 +174,25 @@ class ScheduleHTMLParser(HTMLParser):
         ]
 
 
-async def fetch_schedule_html(url: str) -> str:
+async def fetch_schedule_html(url: str) -> bytes:
     """
     Загрузить HTML страницы расписания.
 
+    Страница возвращается без декодирования: её разбирает parse_schedule_html
+    в пуле процессов, и в процесс передаётся вдвое меньше данных, чем в виде str.
+
     Args:
         url: URL страницы расписания
 
     Returns:
-        HTML содержимое страницы
+        HTML содержимое страницы в кодировке SCHEDULE_ENCODING
 
     Raises:
         aiohttp.ClientError: При ошибках загрузки
     """
     config = get_config()
 
-    async def _fetch() -> str:
+    async def _fetch() -> bytes:
         async with aiohttp.ClientSession() as session:
             async with session.get(
                     url,
@@ -136,48 +200,178 @@ async def fetch_schedule_html(url: str) -> str:
                     timeout=aiohttp.ClientTimeout(total=config.request_timeout)
             ) as response:
                 response.raise_for_status()
-                # Кодировка windows-1251 указана в мета-теге
-                return await response.text(encoding='windows-1251')
+                return await response.read()
 
     return await retry_async(_fetch)
 
 
-def parse_schedule_html(html: str, group_id: int) -> tuple[list[Lesson], list[Lesson]]:
+def _strip_script_block(html: str) -> str:
+    """
+    Вырезать первый блок <SCRIPT>...</SCRIPT> до разбора HTML.
+
+    На странице расписания один скрипт (дата обновления) перед таблицей,
+    данных расписания в нём нет. Ищем его обычным str.find без регулярных
+    выражений, поэтому поиск регистрозависимый (только <SCRIPT в верхнем
+    регистре, как на сайте) и удаляет только первый блок. Это лишь ускорение:
+    остальные скрипты, в том числе <script> в нижнем регистре, обработает
+    HTMLParser как обычно.
+
+    Args:
+        html: HTML страницы расписания
+
+    Returns:
+        HTML без блока скрипта (или исходный HTML, если блока нет)
+    """
+    start = html.find("<SCRIPT")
+    if start < 0:
+        return html
+    end = html.find("</SCRIPT>", start)
+    if end < 0:
+        return html
+    return html[:start] + html[end + len("</SCRIPT>"):]
+
+
+# Теги форматирования <P>, <B>, <I> (с атрибутами и закрывающие). Парсеру они не нужны,
+# а токенизатор тратит на каждый из них отдельный вызов. <FONT> не трогаем:
+# по нему определяются подсветка недели и конец текста ячейки.
+_FORMATTING_TAG_RE = re.compile(r'</?[PBI](?:\s[^>]*)?>', re.IGNORECASE)
+
+
+# Результат обработки одной ячейки расписания
+_CELL_EMPTY = 0
+_CELL_INVALID = 1
+_CELL_BAD_NUMBER = 2
+_CELL_LESSON = 3
+
+# Тексты пустых ячеек (уже обрезанные парсером) - их не нужно разбирать
+_EMPTY_CELL_TEXTS = frozenset(("", "_"))
+
+
+def _parse_cell(
+        cell_text: str,
+        lesson_info: LessonInfo,
+        group_id: int,
+        day_of_week: int,
+        lesson_number: int,
+        lesson_date: date,
+        week_type: WeekType
+) -> tuple[int, Optional[Lesson]]:
+    """
+    Разобрать одну непустую ячейку расписания.
+
+    Args:
+        cell_text: Текст ячейки (уже обрезанный парсером, не из _EMPTY_CELL_TEXTS)
+        lesson_info: Результат parse_lesson_info для cell_text
+        group_id: ID группы
+        day_of_week: День недели (1-7)
+        lesson_number: Номер пары
+        lesson_date: Дата урока
+        week_type: Тип недели
+
+    Returns:
+        Кортеж (статус _CELL_*, урок или None)
+    """
+    if not lesson_info.name:
+        if is_log_enabled(logging.DEBUG):
+            logger.debug(
+                "lesson_no_name",
+                raw_text=cell_text,
+                day=day_of_week,
+                lesson_number=lesson_number,
+                week_type=week_type.value
+            )
+        return _CELL_INVALID, None
+
+    # Получаем время урока
+    lesson_times = (
+        LESSON_TIMES_ARR[lesson_number]
+        if lesson_number < len(LESSON_TIMES_ARR) else None
+    )
+    if lesson_times is None:
+        logger.warning(
+            "invalid_lesson_number",
+            lesson_number=lesson_number,
+            day=day_of_week
+        )
+        return _CELL_BAD_NUMBER, None
+    start_time, end_time = lesson_times
+
+    # Собираем данные о преподавателях и аудиториях
+    teacher_name: Optional[str] = '; '.join(lesson_info.teachers) or None
+    cabinet_number: Optional[str] = '; '.join(lesson_info.cabinets) or None
+
+    return _CELL_LESSON, Lesson(
+        group_id=group_id,
+        name=lesson_info.name,
+        lesson_date=lesson_date,
+        day_of_week=day_of_week,
+        lesson_number=lesson_number,
+        start_time=start_time,
+        end_time=end_time,
+        teacher_name=teacher_name,
+        cabinet_number=cabinet_number,
+        week_type=week_type,
+        lesson_type=lesson_info.lesson_type,
+        raw_text=cell_text,
+        subgroup=lesson_info.subgroup
+    )
+
+
+def parse_schedule_html(
+        html: str | bytes | memoryview,
+        group_id: int
+) -> tuple[list[Lesson], list[Lesson]]:
     """
     Парсинг HTML расписания в структурированные данные.
 
     Поддерживает множественные подгруппы в одной записи.
+    Байты (bytes, bytearray, memoryview) декодируются один раз из SCHEDULE_ENCODING
+    прямо из буфера, без промежуточной копии.
     """
+    if not isinstance(html, str):
+        html = str(html, SCHEDULE_ENCODING)
+
+    html = _FORMATTING_TAG_RE.sub('', _strip_script_block(html))
+
     parser = ScheduleHTMLParser()
     parser.feed(html)
 
-    schedule_data = parser.get_schedule_data()
-
-    even_lessons = []
-    odd_lessons = []
+    schedule_data: list[tuple[list[str], dict[str, bool]]] = parser.get_schedule_data()
 
     # Текущая дата для расчета
-    today = date.today()
+    today: date = date.today()
 
     # Определяем текущий и следующий тип недели с учетом выделения на сайте
-    current_week_type = WeekType(get_week_type_for_date(today))
-    next_week_type = WeekType.ODD if current_week_type == WeekType.EVEN else WeekType.EVEN
+    current_week_type: WeekType = WeekType(get_week_type_for_date(today))
+    next_week_type: WeekType = (
+        WeekType.ODD if current_week_type == WeekType.EVEN else WeekType.EVEN
+    )
 
-    current_week_monday = get_monday_of_week(today)
-    next_week_monday = current_week_monday + timedelta(days=7)
+    current_week_monday: date = get_monday_of_week(today)
+    next_week_monday: date = current_week_monday + timedelta(days=7)
 
-    highlight_present = any(metadata.get("has_blue", False) for _, metadata in schedule_data)
+    highlight_present: bool = any(
+        metadata.get("has_blue", False) for _, metadata in schedule_data
+    )
 
     # Fallback на старую логику, если подсветки нет вообще
-    monday_even = get_monday_of_week(today, week_type="even")
-    monday_odd = get_monday_of_week(today, week_type="odd")
+    monday_even: date = get_monday_of_week(today, week_type="even")
+    monday_odd: date = get_monday_of_week(today, week_type="odd")
+
+    # Все возможные даты уроков: (тип недели, день недели) -> дата
+    week_mondays: dict[WeekType, date] = (
+        {current_week_type: current_week_monday, next_week_type: next_week_monday}
+        if highlight_present
+        else {WeekType.EVEN: monday_even, WeekType.ODD: monday_odd}
+    )
+    date_table: dict[tuple[WeekType, int], date] = {
+        (wt, day): monday + timedelta(days=day - 1)
+        for wt, monday in week_mondays.items()
+        for day in range(1, 8)
+    }
 
-    # Счётчики для логирования
-    total_processed = 0
-    skipped_empty = 0
-    skipped_invalid = 0
-    with_subgroups = 0
-    with_multiple_teachers = 0
+    # Строки расписания с известным днём: (день недели, тип недели, дата, ячейки пар)
+    rows: list[tuple[int, WeekType, date, list[str]]] = []
 
     # Обрабатываем строки расписания
     for row_idx, (row, metadata) in enumerate(schedule_data):
@@ -185,114 +379,66 @@ def parse_schedule_html(html: str, group_id: int) -> tuple[list[Lesson], list[Le
             continue
 
         # Первая ячейка - день недели
-        day_str = normalize_text(row[0]).lower()
-        if not day_str:
+        day_of_week: Optional[int] = get_day_of_week(row[0])
+        if not day_of_week:
+            day_str = normalize_text(row[0]).lower()
+            if day_str:
+                logger.warning("unknown_day_of_week", day_str=day_str, row_idx=row_idx)
             continue
 
-        has_highlight = metadata.get("has_blue", False)
-        row_cells = row[1:]
+        has_highlight: bool = metadata.get("has_blue", False)
+        week_type: WeekType
 
         if highlight_present:
-            if has_highlight:
-                week_type = current_week_type
-                base_monday = current_week_monday
-            else:
-                week_type = next_week_type
-                base_monday = next_week_monday
+            week_type = current_week_type if has_highlight else next_week_type
         else:
             week_type = WeekType.ODD if has_highlight else WeekType.EVEN
-            base_monday = monday_odd if week_type == WeekType.ODD else monday_even
 
-        # Получаем номер дня недели
-        day_of_week = DAY_MAPPING.get(day_str[:3])
-        if not day_of_week:
-            logger.warning("unknown_day_of_week", day_str=day_str, row_idx=row_idx)
-            continue
-
-        # Рассчитываем дату урока
-        days_offset = day_of_week - 1
-        lesson_date = base_monday + timedelta(days=days_offset)
-
-        # Обрабатываем каждую пару
-        for lesson_number, cell_text in enumerate(row_cells, start=1):
-            total_processed += 1
-
-            # Пропускаем пустые уроки
-            if not cell_text or cell_text.strip() in ('_', ''):
-                skipped_empty += 1
-                continue
-
-            # Парсим информацию об уроке
-            lesson_info = parse_lesson_info(cell_text)
-
-            if not lesson_info.name:
-                skipped_invalid += 1
-                logger.debug(
-                    "lesson_no_name",
-                    raw_text=cell_text,
-                    day=day_of_week,
-                    lesson_number=lesson_number,
-                    week_type=week_type.value
-                )
-                continue
-
-            # Получаем время урока
-            start_time, end_time = LESSON_TIMES.get(lesson_number, (None, None))
-            if not start_time:
-                logger.warning(
-                    "invalid_lesson_number",
-                    lesson_number=lesson_number,
-                    day=day_of_week
-                )
-                continue
-
-            # Собираем данные о преподавателях и аудиториях
-            teacher_name = '; '.join(lesson_info.teachers) if lesson_info.teachers else None
-            cabinet_number = '; '.join(lesson_info.cabinets) if lesson_info.cabinets else None
-
-            # Формируем название с учетом подгруппы
-            lesson_name = lesson_info.name
-            if lesson_info.subgroup:
-                lesson_name = f"{lesson_info.name} (подгруппа {lesson_info.subgroup})"
+        rows.append((day_of_week, week_type, date_table[(week_type, day_of_week)], row[1:]))
 
-            # Логируем интересные случаи
-            if lesson_info.subgroup:
-                with_subgroups += 1
-            if len(lesson_info.teachers) > 1:
-                with_multiple_teachers += 1
-
-            # Создаем объект урока
-            lesson = Lesson(
-                group_id=group_id,
-                name=lesson_info.name,
-                lesson_date=lesson_date,
-                day_of_week=day_of_week,
-                lesson_number=lesson_number,
-                start_time=start_time,
-                end_time=end_time,
-                teacher_name=teacher_name,
-                cabinet_number=cabinet_number,
-                week_type=week_type,
-                lesson_type=lesson_info.lesson_type,  # Добавлено
-                raw_text=cell_text,
-                subgroup=lesson_info.subgroup
+    # Разбираем тексты всех непустых ячеек разом (повторяющиеся тексты - один раз)
+    lesson_infos: Iterator[LessonInfo] = iter(parse_lesson_info_batch(
+        [
+            cell_text for *_, cells in rows for cell_text in cells
+            if cell_text not in _EMPTY_CELL_TEXTS
+        ]
+    ))
+
+    # Результаты разбора всех ячеек: (статус, урок)
+    results: list[tuple[int, Optional[Lesson]]] = []
+
+    # Обрабатываем каждую пару
+    for day_of_week, week_type, lesson_date, cells in rows:
+        results.extend(
+            (_CELL_EMPTY, None) if cell_text in _EMPTY_CELL_TEXTS
+            else _parse_cell(
+                cell_text, next(lesson_infos),
+                group_id, day_of_week, lesson_number, lesson_date, week_type
             )
+            for lesson_number, cell_text in enumerate(cells, start=1)
+        )
 
-            # Добавляем в соответствующий список
-            if week_type == WeekType.EVEN:
-                even_lessons.append(lesson)
-            else:
-                odd_lessons.append(lesson)
+    lessons: list[Lesson] = [lesson for _, lesson in results if lesson is not None]
+    even_lessons: list[Lesson] = [
+        lesson for lesson in lessons if lesson.week_type == WeekType.EVEN
+    ]
+    odd_lessons: list[Lesson] = [
+        lesson for lesson in lessons if lesson.week_type != WeekType.EVEN
+    ]
 
     # Логируем статистику парсинга
+    stats = Counter(status for status, _ in results)
     logger.info(
         "schedule_parsing_stats",
         group_id=group_id,
-        total_cells_processed=total_processed,
-        skipped_empty=skipped_empty,
-        skipped_invalid=skipped_invalid,
-        lessons_with_subgroups=with_subgroups,
-        lessons_with_multiple_teachers=with_multiple_teachers,
+        total_cells_processed=len(results),
+        skipped_empty=stats[_CELL_EMPTY],
+        skipped_invalid=stats[_CELL_INVALID],
+        lessons_with_subgroups=sum(1 for lesson in lessons if lesson.subgroup),
+        lessons_with_multiple_teachers=sum(
+            1 for lesson in lessons
+            if lesson.teacher_name and '; ' in lesson.teacher_name
+        ),
         even_lessons=len(even_lessons),
         odd_lessons=len(odd_lessons)
     )
@@ -343,15 +489,8 @@ async def compare_and_update_lessons(
         existing_lessons = await db.get_existing_lessons(group_id, week_type, conn=connection)
 
         # Создаём маппинг с учётом подгруппы
-        existing_map = {
-            (l.day_of_week, l.lesson_number, l.subgroup): l
-            for l in existing_lessons
-        }
-
-        new_map = {
-            (l.day_of_week, l.lesson_number, l.subgroup): l
-            for l in new_lessons
-        }
+        existing_map = {l.key: l for l in existing_lessons}
+        new_map = {l.key: l for l in new_lessons}
 
         to_insert = []
         to_update = []
@@ -362,7 +501,7 @@ async def compare_and_update_lessons(
             existing_lesson = existing_map.get(key)
             if existing_lesson is None:
                 to_insert.append(new_lesson)
-            elif existing_lesson != new_lesson:
+            elif existing_lesson.compare_key != new_lesson.compare_key:
                 new_lesson.lesson_id = existing_lesson.lesson_id
                 to_update.append((existing_lesson, new_lesson))
 
@@ -385,6 +524,9 @@ async def compare_and_update_lessons(
         updated = 0
         deleted = 0
 
+        # Детали по каждому уроку собираем только для DEBUG
+        with_details = is_log_enabled(logging.DEBUG)
+
         added_details: list[dict] = []
         updated_details: list[dict] = []
         deleted_details: list[dict] = []
@@ -424,18 +566,19 @@ async def compare_and_update_lessons(
                 await db.log_schedule_changes_bulk(insert_changes, conn=connection)
 
                 added = len(lesson_ids)
-                added_details = [
-                    {
-                        "lesson_id": lesson_id,
-                        "name": lesson.name,
-                        "type": lesson.lesson_type,
-                        "day": lesson.day_of_week,
-                        "number": lesson.lesson_number,
-                        "teacher": lesson.teacher_name,
-                        "subgroup": lesson.subgroup
-                    }
-                    for lesson_id, lesson in zip(lesson_ids, to_insert)
-                ]
+                if with_details:
+                    added_details = [
+                        {
+                            "lesson_id": lesson_id,
+                            "name": lesson.name,
+                            "type": lesson.lesson_type,
+                            "day": lesson.day_of_week,
+                            "number": lesson.lesson_number,
+                            "teacher": lesson.teacher_name,
+                            "subgroup": lesson.subgroup
+                        }
+                        for lesson_id, lesson in zip(lesson_ids, to_insert)
+                    ]
 
             # Обновление существующих уроков (BULK)
             if to_update:
@@ -476,18 +619,19 @@ async def compare_and_update_lessons(
                 await db.log_schedule_changes_bulk(update_changes, conn=connection)
 
                 updated = len(to_update)
-                updated_details = [
-                    {
-                        "lesson_id": existing_lesson.lesson_id,
-                        "old_name": existing_lesson.name,
-                        "new_name": new_lesson.name,
-                        "type": new_lesson.lesson_type,
-                        "day": new_lesson.day_of_week,
-                        "number": new_lesson.lesson_number,
-                        "subgroup": new_lesson.subgroup
-                    }
-                    for existing_lesson, new_lesson in to_update
-                ]
+                if with_details:
+                    updated_details = [
+                        {
+                            "lesson_id": existing_lesson.lesson_id,
+                            "old_name": existing_lesson.name,
+                            "new_name": new_lesson.name,
+                            "type": new_lesson.lesson_type,
+                            "day": new_lesson.day_of_week,
+                            "number": new_lesson.lesson_number,
+                            "subgroup": new_lesson.subgroup
+                        }
+                        for existing_lesson, new_lesson in to_update
+                    ]
 
             # Удаление отсутствующих уроков (BULK)
             if to_delete:
@@ -520,17 +664,18 @@ async def compare_and_update_lessons(
                 await db.delete_lessons_bulk(lesson_ids_to_delete, conn=connection)
 
                 deleted = len(to_delete)
-                deleted_details = [
-                    {
-                        "lesson_id": existing_lesson.lesson_id,
-                        "name": existing_lesson.name,
-                        "type": existing_lesson.lesson_type,
-                        "day": existing_lesson.day_of_week,
-                        "number": existing_lesson.lesson_number,
-                        "subgroup": existing_lesson.subgroup
-                    }
-                    for existing_lesson in to_delete
-                ]
+                if with_details:
+                    deleted_details = [
+                        {
+                            "lesson_id": existing_lesson.lesson_id,
+                            "name": existing_lesson.name,
+                            "type": existing_lesson.lesson_type,
+                            "day": existing_lesson.day_of_week,
+                            "number": existing_lesson.lesson_number,
+                            "subgroup": existing_lesson.subgroup
+                        }
+                        for existing_lesson in to_delete
+                    ]
 
         logger.info(
             "lessons_transaction_completed",
@@ -539,12 +684,19 @@ async def compare_and_update_lessons(
             added=added,
             updated=updated,
             deleted=deleted,
-            added_lessons=_shorten(added_details),
-            updated_lessons=_shorten(updated_details),
-            deleted_lessons=_shorten(deleted_details),
             duration=round(perf_counter() - phase_started, 4)
         )
 
+        if with_details:
+            logger.debug(
+                "lessons_transaction_details",
+                group_id=group_id,
+                week_type=week_type.value,
+                added_lessons=_shorten(added_details),
+                updated_lessons=_shorten(updated_details),
+                deleted_lessons=_shorten(deleted_details)
+            )
+
         return added, updated, deleted
 
     if conn is not None:
@@ -584,8 +736,18 @@ async def parse_group(group_id: int) -> ParseResult:
         # Загружаем HTML
         html = await fetch_schedule_html(group_info.url)
 
-        # Парсим расписание
-        even_lessons, odd_lessons = parse_schedule_html(html, group_id)
+        # Парсим расписание в отдельном процессе, не блокируя event loop
+        loop = asyncio.get_running_loop()
+        pool = get_parse_pool()
+        try:
+            even_lessons, odd_lessons = await loop.run_in_executor(
+                pool, parse_schedule_html, html, group_id
+            )
+        except BrokenProcessPool:
+            # Воркер упал - пул больше не принимает задачи, пересоздаём
+            logger.warning("parse_pool_broken", group_id=group_id)
+            reset_parse_pool(pool)
+            raise
 
         # Обновляем БД в рамках одного соединения
         async with db.acquire_connection() as conn:
@@ -629,9 +791,11 @@ async def parse_group(group_id: int) -> ParseResult:
         logger.error(
             "parse_group_failed",
             group_id=group_id,
-            error=str(e),
-            exc_info=True
+            error=str(e)
         )
+        # Трассировку форматируем только при DEBUG
+        if is_log_enabled(logging.DEBUG):
+            logger.debug("parse_group_traceback", group_id=group_id, exc_info=True)
         return ParseResult(
             status=False,
             group_id=group_id,
@@ -1,19 +1,30 @@
 """
 Утилиты для парсинга расписания.
 Содержит функции для обработки текста, времени и других вспомогательных операций.
+
+Разбор ячеек упирается в процессор, а не в память: ячейки короткие (десятки символов),
+объём страницы - сотни килобайт. Основное время уходит на движок re и интерпретатор,
+поэтому оптимизации здесь - это меньше вызовов regex (предкомпиляция, быстрые
+проверки подстрок), меньше промежуточных объектов и кэширование повторяющихся ячеек.
 """
 import logging
 import re
+import sys
 import asyncio
-from datetime import date, time, timedelta
+from functools import lru_cache
+from datetime import date, time
 from dataclasses import dataclass
-from typing import Optional, Callable, TypeVar, ParamSpec
+from typing import Any, Optional, Callable, TypeVar, ParamSpec
 import structlog
 
 from .config import get_config
 
 logger = structlog.get_logger()
 
+# Минимальный уровень логирования, выставленный configure_logging
+# (NOTSET - логирование не настраивалось, structlog выводит всё)
+_log_level: int = logging.NOTSET
+
 # Маппинг дней недели
 DAY_MAPPING = {
     "пнд": 1,
@@ -25,6 +36,14 @@ DAY_MAPPING = {
     "вск": 7,
 }
 
+# Названия дней недели, индексируемые номером дня (индекс 0 не используется).
+# Кириллические литералы CPython не интернирует сам, поэтому делаем это явно:
+# одинаковые значения - один объект, сравнение сводится к проверке идентичности
+DAY_NAMES_FULL = tuple(map(sys.intern, (
+    "", "Понедельник", "Вторник", "Среда", "Четверг", "Пятница", "Суббота", "Воскресенье"
+)))
+DAY_NAMES_SHORT = tuple(map(sys.intern, ("", "Пнд", "Втр", "Срд", "Чтв", "Птн", "Сбт", "Вск")))
+
 # Время начала и окончания пар
 LESSON_TIMES = {
     1: (time(9, 0), time(10, 35)),
@@ -35,6 +54,20 @@ LESSON_TIMES = {
     6: (time(18, 5), time(19, 40)),
 }
 
+# Готовые строки "ЧЧ:ММ-ЧЧ:ММ" для стандартных интервалов пар
+_LESSON_TIME_STRINGS: dict[int, str] = {
+    number: f"{start.strftime('%H:%M')}-{end.strftime('%H:%M')}"
+    for number, (start, end) in LESSON_TIMES.items()
+}
+_LESSON_TIME_STRINGS_BY_TIMES: dict[tuple[time, time], str] = {
+    LESSON_TIMES[number]: text for number, text in _LESSON_TIME_STRINGS.items()
+}
+
+# Те же интервалы списком, индексируемым номером пары (индекс 0 не используется)
+LESSON_TIMES_ARR: list[Optional[tuple[time, time]]] = [
+    LESSON_TIMES.get(number) for number in range(max(LESSON_TIMES) + 1)
+]
+
 # Типы занятий
 LESSON_TYPE_PREFIXES = {
     "лек.": "Лекция",
@@ -43,35 +76,76 @@ LESSON_TYPE_PREFIXES = {
     "сем.": "Семинар",
     "конс.": "Консультация",
 }
-
-
-@dataclass
+LESSON_TYPE_PREFIXES = {prefix: sys.intern(name) for prefix, name in LESSON_TYPE_PREFIXES.items()}
+
+# Паттерны разбора ячейки урока (компилируются один раз при импорте)
+# Неразрывный пробел -> пробел, пробел нулевой ширины удаляется
+_NORMALIZE_TABLE = str.maketrans({'\xa0': ' ', '\u200b': ''})
+_SUBGROUP_RE = re.compile(r'[-\s]*(\d)\s*п/г', re.IGNORECASE)
+# ФИО преподавателя (регистрозависимо)
+_TEACHER_RE = re.compile(r'[А-ЯЁ]+(?:-[А-ЯЁ]+)?\s+(?:[А-ЯЁ]{1,2}\.?[А-ЯЁ]\.?)')
+# То же, но совпадение начинается только в начале серии заглавных букв:
+# длинная серия без инициалов просматривается один раз, а не с каждой позиции.
+# Проверка стоит после первой буквы, чтобы поиск начала шёл по классу символов
+_TEACHER_SCAN_RE = re.compile(r'[А-ЯЁ](?<![А-ЯЁ]{2})[А-ЯЁ]*(?:-[А-ЯЁ]+)?\s+(?:[А-ЯЁ]{1,2}\.?[А-ЯЁ]\.?)')
+# Аудитория (без учёта регистра). Слитые комментарии (а.0425и/д, а.8240эбж)
+# покрываются классом букв и /[а-я]+
+_CABINET_RE = re.compile(r'а\.[\dа-яА-Я\-]+(?:/[а-яА-Я]+)?', re.IGNORECASE)
+# Отдельно стоящие комментарии ("и/д", "эбж", "экол", "ТМиОК") и текст в скобках.
+# Каждый паттерн идёт в паре с литералом (в нижнем регистре), без которого он не совпадёт.
+_COMMENT_PATTERNS = (
+    ('и/д', re.compile(r'\s+и/д(?:экол)?\s*', re.IGNORECASE)),
+    ('эбж', re.compile(r'\s+эбж\s*', re.IGNORECASE)),
+    ('экол', re.compile(r'\s+экол\s*', re.IGNORECASE)),
+    ('тмиок', re.compile(r'\s+ТМиОК\s*', re.IGNORECASE)),
+    ('(', re.compile(r'\([^)]*\)')),
+)
+# Заглавные кириллические буквы (из них состоят ФИО преподавателей)
+_UPPER_CYR = frozenset('АБВГДЕЁЖЗИЙКЛМНОПРСТУФХЦЧШЩЪЫЬЭЮЯ')
+# Паттерны очистки названия дисциплины и ФИО
+_TAIL_COMMENT_RE = re.compile(r'\s+(?:эбж|экол|ТМиОК)$', re.IGNORECASE)
+_TAIL_COMMENT_SUFFIXES = ('эбж', 'экол', 'тмиок')
+_TAIL_DOT_RE = re.compile(r'\s+\.$')
+_TAIL_INITIALS_RE = re.compile(r'\s+[А-ЯЁ]{1,3}\.?(?:[А-ЯЁ]\.?)?$')
+_TAIL_SLASH_RE = re.compile(r'/[а-яА-Я]+$')
+_TAIL_ID_RE = re.compile(r'и/д(?:экол)?$', re.IGNORECASE)
+_INITIALS_RE = re.compile(r'^[А-ЯЁ]{2,3}$')
+# Пул уже встречавшихся ФИО, аудиторий и названий дисциплин:
+# одни и те же строки повторяются в расписании десятки раз
+_STRING_POOL: dict[str, str] = {}
+_STRING_POOL_MAX = 8192
+_POOLED_STRING_MAX_LEN = 128
+_INITIAL_GAP_RE = re.compile(r'([А-ЯЁ])(?=[А-ЯЁ])')
+# Префикс типа занятия в начале строки (все варианты из LESSON_TYPE_PREFIXES)
+_LESSON_TYPE_RE = re.compile(
+    r'(' + '|'.join(map(re.escape, LESSON_TYPE_PREFIXES)) + r')\s*',
+    re.IGNORECASE
+)
+
+
+@dataclass(slots=True, frozen=True)
 class LessonInfo:
     """
     Структура с распарсенной информацией об уроке.
 
+    Неизменяемая: результаты parse_lesson_info кэшируются, и один экземпляр
+    отдаётся всем ячейкам с тем же текстом.
+
     Attributes:
         name: Название дисциплины (без префикса типа занятия)
         lesson_type: Тип занятия (лекция, практика и т.д.)
-        teachers: Список преподавателей
-        cabinets: Список аудиторий
+        teachers: Кортеж преподавателей
+        cabinets: Кортеж аудиторий
         subgroup: Номер подгруппы (1, 2) или None
         comment: Дополнительный комментарий (например, "и/д", "и/дэкол")
     """
     name: str
     lesson_type: Optional[str] = None
-    teachers: list[str] = None
-    cabinets: list[str] = None
+    teachers: tuple[str, ...] = ()
+    cabinets: tuple[str, ...] = ()
     subgroup: Optional[int] = None
     comment: Optional[str] = None
 
-    def __post_init__(self):
-        """Инициализация пустых списков."""
-        if self.teachers is None:
-            self.teachers = []
-        if self.cabinets is None:
-            self.cabinets = []
-
     def __repr__(self) -> str:
         """Строковое представление для отладки."""
         type_str = f", type={self.lesson_type}" if self.lesson_type else ""
@@ -82,6 +156,10 @@ class LessonInfo:
         )
 
 
+# Результат разбора пустой ячейки; LessonInfo неизменяем, поэтому экземпляр общий
+_EMPTY_LESSON_INFO = LessonInfo(name="")
+
+
 def normalize_text(text: str) -> str:
     """
     Нормализация текста: удаление лишних пробелов и спецсимволов.
@@ -95,13 +173,31 @@ def normalize_text(text: str) -> str:
     if not text:
         return ""
 
-    # Удаляем неразрывные пробелы и другие невидимые символы
-    text = text.replace('\xa0', ' ').replace('\u200b', '')
+    # Быстрый путь: isprintable() ложно для любых пробельных символов, кроме
+    # обычного пробела (и для \xa0/\u200b), так что остаётся только обрезать края
+    if text.isprintable() and '  ' not in text:
+        return text.strip()
 
-    # Удаляем множественные пробелы
-    text = re.sub(r'\s+', ' ', text)
+    # Удаляем неразрывные пробелы и другие невидимые символы, затем схлопываем
+    # множественные пробелы (split() режет по тем же символам, что и \s)
+    return ' '.join(text.translate(_NORMALIZE_TABLE).split())
 
-    return text.strip()
+
+@lru_cache(maxsize=64)
+def get_day_of_week(day_str: str) -> Optional[int]:
+    """
+    Определить номер дня недели по тексту первой ячейки строки.
+
+    Ячеек с днями недели всего несколько видов ("Пнд", "Втр", ...),
+    поэтому результат кэшируется по исходному тексту ячейки.
+
+    Args:
+        day_str: Текст ячейки с днём недели
+
+    Returns:
+        Номер дня недели (1-7) или None, если день не распознан
+    """
+    return DAY_MAPPING.get(normalize_text(day_str).lower()[:3])
 
 
 def extract_lesson_type(text: str) -> tuple[Optional[str], str]:
@@ -116,9 +212,9 @@ def extract_lesson_type(text: str) -> tuple[Optional[str], str]:
     """
     text = text.strip()
 
-    for prefix, lesson_type in LESSON_TYPE_PREFIXES.items():
-        if text.lower().startswith(prefix):
-            return lesson_type, text[len(prefix):].strip()
+    match = _LESSON_TYPE_RE.match(text)
+    if match:
+        return LESSON_TYPE_PREFIXES[match.group(1).lower()], text[match.end():]
 
     return None, text
 
@@ -138,9 +234,8 @@ def extract_subgroup(text: str) -> tuple[Optional[int], str]:
     Returns:
         Кортеж (номер_подгруппы, текст_без_подгруппы)
     """
-    # Паттерн для поиска подгруппы
-    subgroup_pattern = r'[-\s]*(\d)\s*п/г'
-    match = re.search(subgroup_pattern, text, re.IGNORECASE)
+    # Без "/" маркера "п/г" быть не может - не запускаем regex
+    match = _SUBGROUP_RE.search(text) if '/' in text else None
 
     if match:
         subgroup_num = int(match.group(1))
@@ -151,6 +246,35 @@ def extract_subgroup(text: str) -> tuple[Optional[int], str]:
 
     return None, text
 
+
+def _split_cabinets(
+        segment: str,
+        has_cabinets: bool,
+        cabinets: list[str],
+        parts: list[str]
+) -> None:
+    """
+    Вырезать аудитории из участка текста между ФИО преподавателей.
+
+    Args:
+        segment: Участок текста без ФИО
+        has_cabinets: False, если "а." во всём тексте нет и искать нечего
+        cabinets: Список, в который добавляются найденные аудитории
+        parts: Список, в который добавляются участки текста без аудиторий
+    """
+    if not has_cabinets:
+        parts.append(segment)
+        return
+
+    last_end = 0
+    for match in _CABINET_RE.finditer(segment):
+        start, end = match.span()
+        cabinets.append(_intern_string(segment[start:end]))
+        parts.append(segment[last_end:start])
+        last_end = end
+    parts.append(segment[last_end:])
+
+
 def extract_teachers_and_cabinets(text: str) -> tuple[list[str], list[str], str]:
     """
     Извлекает преподавателей и аудитории из текста.
@@ -158,7 +282,7 @@ def extract_teachers_and_cabinets(text: str) -> tuple[list[str], list[str], str]
     ВАЖНО: Порядок обработки критичен!
     1. Извлекаем отдельные комментарии (не слитые с аудиториями)
     2. Извлекаем ФИО преподавателей (чтобы их инициалы не спутать с аудиториями)
-    3. Извлекаем аудитории (с прилипшими комментариями)
+    3. Извлекаем аудитории (с прилипшими комментариями) в промежутках между ФИО
     4. Оставшееся - название
 
     Примеры:
@@ -168,6 +292,8 @@ def extract_teachers_and_cabinets(text: str) -> tuple[list[str], list[str], str]
       -> name="Информатика", teachers=["ЦЫРЕНОВА А.Ю.А."], cabinets=["а.1-17д/кл"]
     - "Русский язык АНГАРХАЕВА Ю.П. а.0425и/д"
       -> name="Русский язык", teachers=["АНГАРХАЕВА Ю.П."], cabinets=["а.0425и/д"]
+    - "Физика а.8240ИВАНОВ И.И." (ФИО прилипло к аудитории)
+      -> name="Физика", teachers=["ИВАНОВ И.И."], cabinets=["а.8240"]
 
     Args:
         text: Текст с информацией о преподавателях и аудиториях
@@ -190,45 +316,52 @@ def extract_teachers_and_cabinets(text: str) -> tuple[list[str], list[str], str]
     #   1) И.О. (стандарт: Б.В., А.М.)
     #   2) ИО.И (слипшиеся: АЮ.А)
     #   3) И.О (без точки в конце: А.В)
-
-    # Расширенный паттерн для инициалов
-    teacher_pattern = r'[А-ЯЁ]+(?:-[А-ЯЁ]+)?\s+(?:[А-ЯЁ]{1,2}\.?[А-ЯЁ]\.?)'
-
-    teacher_matches = list(re.finditer(teacher_pattern, working_text))
-    for match in reversed(teacher_matches):  # Удаляем с конца
-        teacher = match.group(0).strip()
-
-        # Нормализуем инициалы: добавляем точки если их нет
-        teacher = normalize_teacher_name(teacher)
-
-        teachers.insert(0, teacher)
-        # Удаляем из текста, заменяя пробелом
-        working_text = working_text[:match.start()] + ' ' + working_text[match.end():]
-
-    # ЭТАП 2: Извлекаем аудитории (после того как убрали ФИО)
-    # Паттерн для аудитории с возможными СЛИТЫМИ комментариями
-    # Примеры:
+    #
+    # ЭТАП 2: Извлекаем аудитории только в промежутках между ФИО, иначе класс
+    # букв аудитории поглотит прилипшую фамилию ("а.8240ИВАНОВ И.И.").
+    # Аудитория может содержать буквы, цифры, дефисы и СЛИТЫЕ комментарии:
     #   - а.0426
     #   - а.1-17д/кл (с комментарием /кл)
     #   - а.0425и/д (с комментарием и/д)
     #   - а.8240эбж (с комментарием эбж)
     #   - а.726-2 ТМиОК (ТМиОК отдельно, не включается)
-
-    # Расширенный паттерн: аудитория может содержать буквы, цифры, дефисы и слитые комментарии
-    cabinet_pattern = r'а\.[\dа-яА-Я\-]+(?:/[а-яА-Я]+|и/д(?:экол)?|эбж|экол)?'
-
-    cabinet_matches = list(re.finditer(cabinet_pattern, working_text, re.IGNORECASE))
-    for match in reversed(cabinet_matches):  # Удаляем с конца
-        cabinet = match.group(0)
-        cabinets.insert(0, cabinet)
-        # Удаляем из текста, заменяя пробелом
-        working_text = working_text[:match.start()] + ' ' + working_text[match.end():]
+    #
+    # Найденные фрагменты вырезаются, остаток текста собирается из промежутков
+    # одним join.
+    #
+    # Быстрая проверка: аудитории без "а." не бывает, а ФИО содержит минимум
+    # две заглавные кириллические буквы после первого символа. Ячейки с одним
+    # названием дисциплины ("Физкультура", "Основы IT") регулярные выражения
+    # не проходят. islower() дешевле и отсекает большинство ячеек сразу.
+    has_cabinets = 'а.' in working_text or 'А.' in working_text
+    tail = working_text[1:]
+    if has_cabinets or not (tail.islower() or _UPPER_CYR.isdisjoint(tail)):
+        parts: list[str] = []
+        last_end = 0
+        while True:
+            match = None
+            # Предыдущее ФИО закончилось посреди серии заглавных букв (инициалы
+            # без точки): поиск продолжается ровно с этой позиции, как в finditer
+            if (0 < last_end < len(working_text)
+                    and working_text[last_end - 1] in _UPPER_CYR
+                    and working_text[last_end] in _UPPER_CYR):
+                match = _TEACHER_RE.match(working_text, last_end)
+            if match is None:
+                match = _TEACHER_SCAN_RE.search(working_text, last_end)
+                if match is None:
+                    break
+            start, end = match.span()
+            # Нормализуем инициалы: добавляем точки если их нет
+            teachers.append(normalize_teacher_name(working_text[start:end]))
+            _split_cabinets(working_text[last_end:start], has_cabinets, cabinets, parts)
+            last_end = end
+        _split_cabinets(working_text[last_end:], has_cabinets, cabinets, parts)
+        working_text = ' '.join(parts)
 
     # ЭТАП 3: Очищаем оставшийся текст
-    # Удаляем дефисы, которые использовались как разделители
-    working_text = re.sub(r'\s*-\s*', ' ', working_text)
-    # Удаляем множественные пробелы
-    working_text = re.sub(r'\s+', ' ', working_text).strip()
+    # Удаляем дефисы, которые использовались как разделители, и множественные пробелы
+    # (str.split() без аргументов режет по тем же символам, что и \s)
+    working_text = ' '.join(working_text.replace('-', ' ').split())
 
     return teachers, cabinets, working_text
 
@@ -263,18 +396,38 @@ def normalize_teacher_name(name: str) -> str:
     initials_clean = initials.replace('.', '')
 
     # Если инициалы - это 2-3 заглавные буквы, расставляем точки
-    if re.match(r'^[А-ЯЁ]{2,3}$', initials_clean):
+    if _INITIALS_RE.match(initials_clean):
         # "АЮА" -> "А.Ю.А."
         formatted = '.'.join(initials_clean) + '.'
-        return f"{surname} {formatted}"
+        return _intern_string(f"{surname} {formatted}")
 
     # Если инициалы уже с точками, но возможно не все
     # "А.М" -> "А.М.", "АЮ.А" -> "А.Ю.А."
-    initials_normalized = re.sub(r'([А-ЯЁ])(?=[А-ЯЁ])', r'\1.', initials_clean)
+    initials_normalized = _INITIAL_GAP_RE.sub(r'\1.', initials_clean)
     if not initials_normalized.endswith('.'):
         initials_normalized += '.'
 
-    return f"{surname} {initials_normalized}"
+    return _intern_string(f"{surname} {initials_normalized}")
+
+
+def _intern_string(value: str) -> str:
+    """
+    Возвращает единственный экземпляр строки из пула _STRING_POOL.
+
+    Пул ограничен по размеру, чтобы не расти бесконечно в долгоживущем процессе.
+
+    Args:
+        value: ФИО, номер аудитории или название дисциплины
+
+    Returns:
+        Ранее сохранённая строка с тем же значением или сама value
+    """
+    pooled = _STRING_POOL.get(value)
+    if pooled is not None:
+        return pooled
+    if len(value) <= _POOLED_STRING_MAX_LEN and len(_STRING_POOL) < _STRING_POOL_MAX:
+        _STRING_POOL[value] = value
+    return value
 
 
 def extract_comment(text: str) -> tuple[Optional[str], str]:
@@ -290,30 +443,36 @@ def extract_comment(text: str) -> tuple[Optional[str], str]:
     Returns:
         Кортеж (комментарий, текст_без_комментария)
     """
-    # Паттерны для ОТДЕЛЬНО СТОЯЩИХ комментариев
-    # Важно: должны быть окружены пробелами или быть в конце строки
-    comment_patterns = [
-        r'\s+и/д(?:экол)?\s*',  # и/д, и/дэкол (отдельно)
-        r'\s+эбж\s*',  # эбж (отдельно)
-        r'\s+экол\s*',  # экол (отдельно)
-        r'\s+ТМиОК\s*',  # ТМиОК (отдельно)
-        r'\(.*?\)',  # Текст в скобках
-    ]
-
-    comments = []
+    # Паттерны применяются по очереди: каждый следующий ищет уже в тексте,
+    # где предыдущие комментарии заменены пробелом.
+    # Быстрая проверка подстрок: в большинстве ячеек комментариев нет
+    lowered = text.lower()
+    found_by_pattern = []
     working_text = text
 
-    for pattern in comment_patterns:
-        matches = list(re.finditer(pattern, working_text, re.IGNORECASE))
-        for match in reversed(matches):  # Удаляем с конца
-            comment = match.group(0).strip()
-            comments.append(comment)
-            working_text = working_text[:match.start()] + ' ' + working_text[match.end():]
+    for literal, pattern in _COMMENT_PATTERNS:
+        if literal not in lowered:
+            continue
+
+        found = []
+        parts = []
+        last_end = 0
+        for match in pattern.finditer(working_text):
+            found.append(match.group(0).strip())
+            parts.append(working_text[last_end:match.start()])
+            last_end = match.end()
 
-    # Объединяем все комментарии
-    combined_comment = ' '.join(reversed(comments)) if comments else None
+        if found:
+            parts.append(working_text[last_end:])
+            working_text = ' '.join(parts)
+            found_by_pattern.append(found)
 
-    return combined_comment, working_text.strip()
+    if not found_by_pattern:
+        return None, text.strip()
+
+    # Объединяем все комментарии: последние паттерны первыми, внутри паттерна - по порядку
+    comments = [comment for found in reversed(found_by_pattern) for comment in found]
+    return ' '.join(comments), working_text.strip()
 
 
 def clean_discipline_name(name: str) -> str:
@@ -335,23 +494,33 @@ def clean_discipline_name(name: str) -> str:
     if not name:
         return name
 
+    # Каждый паттерн срабатывает только на хвосте строки, поэтому сначала
+    # проверяем последние символы и запускаем regex лишь при возможном совпадении.
+    # `$` допускает завершающий \n - такие строки проверяем всеми паттернами
+    check_all = name.endswith('\n')
+
     # Убираем ОТДЕЛЬНЫЕ комментарии в конце названия
     # Важно: они уже должны быть удалены, но на всякий случай
-    name = re.sub(r'\s+(?:эбж|экол|ТМиОК)$', '', name, flags=re.IGNORECASE)
+    if check_all or name[-5:].lower().endswith(_TAIL_COMMENT_SUFFIXES):
+        name = _TAIL_COMMENT_RE.sub('', name)
 
     # Убираем одинокие точки в конце (артефакты от инициалов)
-    name = re.sub(r'\s+\.$', '', name)
+    if check_all or name.endswith('.'):
+        name = _TAIL_DOT_RE.sub('', name)
 
     # Убираем одинокие инициалы (например " А." или " И.О." или " АЮ.А")
-    name = re.sub(r'\s+[А-ЯЁ]{1,3}\.?(?:[А-ЯЁ]\.?)?$', '', name)
+    if check_all or name.endswith('.') or name[-1:].isupper():
+        name = _TAIL_INITIALS_RE.sub('', name)
 
     # Убираем слитые комментарии, если они случайно попали в название
     # (не должно происходить, но на всякий случай)
-    name = re.sub(r'/[а-яА-Я]+$', '', name)
-    name = re.sub(r'и/д(?:экол)?$', '', name, flags=re.IGNORECASE)
+    if '/' in name:
+        name = _TAIL_SLASH_RE.sub('', name)
+        name = _TAIL_ID_RE.sub('', name)
 
-    # Убираем множественные пробелы
-    name = re.sub(r'\s+', ' ', name)
+    # Убираем множественные пробелы (split() режет по тем же символам, что и \s)
+    if not name.isprintable() or '  ' in name:
+        return ' '.join(name.split())
 
     return name.strip()
 
@@ -373,16 +542,36 @@ def parse_lesson_info(raw_text: str) -> LessonInfo:
     Returns:
         LessonInfo с распарсенными данными
     """
-    if not raw_text or raw_text.strip() in ('_', ''):
-        return LessonInfo(name="")
+    stripped = raw_text.strip()
+    if not stripped or stripped == '_':
+        return _EMPTY_LESSON_INFO
 
-    text = normalize_text(raw_text)
+    return _parse_normalized_lesson_info(raw_text, normalize_text(stripped))
 
+
+def _parse_normalized_lesson_info(
+        raw_text: str,
+        text: str,
+        has_subgroup: bool = True
+) -> LessonInfo:
+    """
+    Разбор уже нормализованного текста урока (шаги 1-5 parse_lesson_info).
+
+    Args:
+        raw_text: Сырой текст из HTML ячейки (для логов)
+        text: Результат normalize_text(raw_text)
+        has_subgroup: False, если уже известно, что маркера подгруппы в тексте нет
+
+    Returns:
+        LessonInfo с распарсенными данными
+    """
     # 1. Извлекаем тип занятия
     lesson_type, text = extract_lesson_type(text)
 
     # 2. Извлекаем подгруппу
-    subgroup, text = extract_subgroup(text)
+    subgroup: Optional[int] = None
+    if has_subgroup:
+        subgroup, text = extract_subgroup(text)
 
     # 3. Извлекаем преподавателей, аудитории; оставшееся - название
     teachers, cabinets, lesson_name = extract_teachers_and_cabinets(text)
@@ -392,24 +581,52 @@ def parse_lesson_info(raw_text: str) -> LessonInfo:
 
     # 5. Если название пустое, но есть данные, логируем предупреждение
     if not lesson_name and (teachers or cabinets):
-        logger.warning(
-            "lesson_name_empty",
-            raw_text=raw_text,
-            teachers=teachers,
-            cabinets=cabinets
-        )
+        if is_log_enabled(logging.WARNING):
+            logger.warning(
+                "lesson_name_empty",
+                raw_text=raw_text,
+                teachers=teachers,
+                cabinets=cabinets
+            )
         # В крайнем случае используем весь текст как название
         lesson_name = text
 
     return LessonInfo(
-        name=lesson_name,
+        name=_intern_string(lesson_name),
         lesson_type=lesson_type,
-        teachers=teachers,
-        cabinets=cabinets,
+        teachers=tuple(teachers),
+        cabinets=tuple(cabinets),
         subgroup=subgroup,
         comment=None
     )
 
+
+# Разбор ячейки - чистая функция текста; кэш живёт всё время работы процесса
+# и переиспользуется между расписаниями разных групп (общие пары, пустые ячейки)
+_parse_lesson_info_cached = lru_cache(maxsize=4096)(parse_lesson_info)
+
+
+def parse_lesson_info_batch(raw_texts: list[str]) -> list[LessonInfo]:
+    """
+    Парсит список сырых текстов уроков.
+
+    В расписании одни и те же ячейки (пустые, "_", повторяющиеся пары)
+    встречаются многократно - и внутри одного расписания, и у разных групп.
+    Каждый уникальный текст разбирается один раз за время жизни процесса.
+    Для одинаковых текстов возвращается один и тот же объект LessonInfo -
+    его нельзя изменять. По той же причине предупреждение lesson_name_empty
+    пишется один раз на каждый уникальный текст в процессе-воркере, а не
+    для каждой ячейки.
+
+    Args:
+        raw_texts: Сырые тексты из HTML ячеек
+
+    Returns:
+        Список LessonInfo в том же порядке, что и raw_texts
+    """
+    return list(map(_parse_lesson_info_cached, raw_texts))
+
+
 def parse_lesson_info_with_subgroups(raw_text: str) -> list[LessonInfo]:
     """
     Парсит сырой текст урока, поддерживая множественные подгруппы.
@@ -429,21 +646,22 @@ def parse_lesson_info_with_subgroups(raw_text: str) -> list[LessonInfo]:
     Returns:
         Список LessonInfo (обычно один элемент, несколько если есть разделение по подгруппам)
     """
-    if not raw_text or raw_text.strip() in ('_', ''):
-        return [LessonInfo(name="")]
+    stripped = raw_text.strip()
+    if not stripped or stripped == '_':
+        return [_EMPTY_LESSON_INFO]
 
-    text = normalize_text(raw_text)
+    text = normalize_text(stripped)
 
     # Проверяем, есть ли явное разделение по подгруппам
     # Ищем паттерн: "... 1 п/г ... 2 п/г ..."
-    subgroup_divider_pattern = r'[-\s]*(\d)\s*п/г'
-    subgroup_matches = list(re.finditer(subgroup_divider_pattern, text, re.IGNORECASE))
+    subgroup_matches = list(_SUBGROUP_RE.finditer(text)) if '/' in text else []
 
     # Если нашли несколько упоминаний подгрупп, проверяем разные ли они
     if len(subgroup_matches) > 1:
-        subgroup_numbers = [int(m.group(1)) for m in subgroup_matches]
+        # Номер подгруппы - одна цифра, поэтому достаточно сравнить строки
+        first_number = subgroup_matches[0].group(1)
         # Если подгруппы разные, разбиваем на несколько записей
-        if len(set(subgroup_numbers)) > 1:
+        if any(m.group(1) != first_number for m in subgroup_matches):
             lesson_infos = []
 
             # Извлекаем тип занятия из начала (общий для всех)
@@ -474,21 +692,54 @@ def parse_lesson_info_with_subgroups(raw_text: str) -> list[LessonInfo]:
                     lesson_name = base_name
 
                 lesson_infos.append(LessonInfo(
-                    name=lesson_name,
+                    name=_intern_string(lesson_name),
                     lesson_type=lesson_type,
-                    teachers=teachers,
-                    cabinets=cabinets,
+                    teachers=tuple(teachers),
+                    cabinets=tuple(cabinets),
                     subgroup=subgroup_num,
                     comment=None
                 ))
 
             return lesson_infos
 
-    # Обычный случай - одна подгруппа или без подгрупп
-    lesson_info = parse_lesson_info(raw_text)
+    # Обычный случай - одна подгруппа или без подгрупп.
+    # Текст уже нормализован, а если маркеров подгрупп не нашлось во всём
+    # тексте, их не будет и после отделения типа занятия
+    lesson_info = _parse_normalized_lesson_info(
+        raw_text, text, has_subgroup=bool(subgroup_matches)
+    )
     return [lesson_info]
 
 
+def _monday_ordinal(d_ord: int) -> int:
+    """
+    Порядковый номер (date.toordinal) понедельника недели, содержащей день d_ord.
+
+    День с номером 1 (01.01.0001) - понедельник, поэтому (d_ord - 1) % 7 - это weekday().
+    """
+    return d_ord - (d_ord - 1) % 7
+
+
+@lru_cache(maxsize=16)
+def _first_week_monday_ordinal(year: int) -> int:
+    """Порядковый номер понедельника недели, содержащей 1 сентября года year."""
+    return _monday_ordinal(date(year, 9, 1).toordinal())
+
+
+def get_week_number_from_ordinals(target_ord: int, sept1_ord: int) -> int:
+    """
+    Номер учебной недели по порядковым номерам дат (date.toordinal).
+
+    Args:
+        target_ord: Порядковый номер целевой даты
+        sept1_ord: Порядковый номер 1 сентября учебного года
+
+    Returns:
+        Номер недели (1 - неделя, содержащая 1 сентября)
+    """
+    return (target_ord - _monday_ordinal(sept1_ord)) // 7 + 1
+
+
 def get_monday_of_week(target_date: date, week_type: Optional[str] = None) -> date:
     """
     Получить дату понедельника для заданной даты с учетом типа недели.
@@ -502,19 +753,20 @@ def get_monday_of_week(target_date: date, week_type: Optional[str] = None) -> da
         Дата понедельника
     """
     # Находим понедельник текущей недели
-    days_since_monday = target_date.weekday()
-    monday = target_date - timedelta(days=days_since_monday)
+    monday_ord = _monday_ordinal(target_date.toordinal())
+    monday = date.fromordinal(monday_ord)
 
     # Если нужен конкретный тип недели, корректируем
     if week_type is not None:
         current_week_type = get_week_type_for_date(monday)
         if current_week_type != week_type:
             # Сдвигаем на неделю вперед
-            monday = monday + timedelta(days=7)
+            monday = date.fromordinal(monday_ord + 7)
 
     return monday
 
 
+@lru_cache(maxsize=1024)
 def get_academic_year(target_date: date) -> tuple[int, int]:
     """
     Получить учебный год для заданной даты.
@@ -531,6 +783,7 @@ def get_academic_year(target_date: date) -> tuple[int, int]:
     return (year, year + 1)
 
 
+@lru_cache(maxsize=1024)
 def get_academic_year_start(target_date: date) -> date:
     """
     Получить дату начала учебного года (1 сентября) для заданной даты.
@@ -547,6 +800,7 @@ def get_academic_year_start(target_date: date) -> date:
     return date(year, 9, 1)
 
 
+@lru_cache(maxsize=1024)
 def get_week_type_for_date(target_date: date) -> str:
     """
     Определить тип недели для конкретной даты по учебному календарю.
@@ -554,47 +808,38 @@ def get_week_type_for_date(target_date: date) -> str:
     Правило: неделя, которая содержит 1-7 сентября, считается нечетной (первой),
     далее недели чередуются.
 
+    Результат кэшируется: за один прогон функция вызывается с небольшим
+    набором одних и тех же дат.
+
     Args:
         target_date: Дата для определения типа недели
 
     Returns:
         "even" или "odd"
     """
-    # Определяем начало учебного года (1 сентября)
-    year = target_date.year
-
-    # Если мы до сентября, то это предыдущий учебный год
-    if target_date.month < 9:
-        year -= 1
-
-    # Первое сентября текущего учебного года
-    academic_year_start = date(year, 9, 1)
-
-    # Если дата раньше начала учебного года, возвращаем odd
-    if target_date < academic_year_start:
-        return "odd"
-
-    # Находим понедельник недели, содержащей 1 сентября
-    # Это будет начало первой учебной недели
-    sept_1_weekday = academic_year_start.weekday()  # 0=понедельник, 6=воскресенье
-    first_week_monday = academic_year_start - timedelta(days=sept_1_weekday)
-
-    # Вычисляем количество полных недель от начала первой учебной недели
-    days_diff = (target_date - first_week_monday).days
+    # Определяем учебный год: до сентября - предыдущий.
+    # Так выбранное 1 сентября никогда не позже target_date
+    year = target_date.year - (target_date.month < 9)
+
+    # Считаем полные недели от понедельника недели, содержащей 1 сентября
+    # (начало первой учебной недели)
+    first_week_monday_ord = _first_week_monday_ordinal(year)
+    days_diff = target_date.toordinal() - first_week_monday_ord
     week_number = (days_diff // 7) + 1
 
     # Первая неделя (содержащая 1-7 сентября) - нечетная
     week_type = "even" if week_number % 2 == 0 else "odd"
 
-    logger.debug(
-        "week_type_calculated",
-        target_date=target_date.isoformat(),
-        academic_year_start=academic_year_start.isoformat(),
-        first_week_monday=first_week_monday.isoformat(),
-        days_diff=days_diff,
-        week_number=week_number,
-        week_type=week_type
-    )
+    if is_log_enabled(logging.DEBUG):
+        logger.debug(
+            "week_type_calculated",
+            target_date=target_date.isoformat(),
+            academic_year_start=date(year, 9, 1).isoformat(),
+            first_week_monday=date.fromordinal(first_week_monday_ord).isoformat(),
+            days_diff=days_diff,
+            week_number=week_number,
+            week_type=week_type
+        )
 
     return week_type
 
@@ -610,6 +855,7 @@ def get_current_week_type() -> str:
     return get_week_type_for_date(today)
 
 
+@lru_cache(maxsize=1024)
 def get_week_number_in_academic_year(target_date: date) -> int:
     """
     Получить номер учебной недели в учебном году.
@@ -621,11 +867,9 @@ def get_week_number_in_academic_year(target_date: date) -> int:
         Номер недели (начиная с 1 для первой недели)
     """
     academic_year_start = get_academic_year_start(target_date)
-    sept_1_weekday = academic_year_start.weekday()
-    first_week_monday = academic_year_start - timedelta(days=sept_1_weekday)
-
-    days_diff = (target_date - first_week_monday).days
-    week_number = (days_diff // 7) + 1
+    week_number = get_week_number_from_ordinals(
+        target_date.toordinal(), academic_year_start.toordinal()
+    )
 
     return max(1, week_number)
 
@@ -666,6 +910,22 @@ P = ParamSpec('P')
 T = TypeVar('T')
 
 
+@lru_cache(maxsize=8)
+def _retry_delays(max_retries: int, retry_delay: float, base: float) -> tuple[float, ...]:
+    """
+    Задержки перед повторными попытками (экспоненциальный рост).
+
+    Args:
+        max_retries: Максимальное число попыток
+        retry_delay: Задержка перед второй попыткой
+        base: Основание экспоненты
+
+    Returns:
+        Кортеж задержек; элемент i - пауза после неудачной попытки i + 1
+    """
+    return tuple(retry_delay * base ** i for i in range(max_retries - 1))
+
+
 async def retry_async(
         func: Callable[P, T],
         *args: P.args,
@@ -686,28 +946,32 @@ async def retry_async(
         Exception: Последнее исключение после всех попыток
     """
     config = get_config()
+    max_retries = config.max_retries
+    delays = _retry_delays(max_retries, config.retry_delay, config.retry_exponential_base)
     last_exception = None
 
-    for attempt in range(1, config.max_retries + 1):
+    for attempt in range(1, max_retries + 1):
         try:
             return await func(*args, **kwargs)
         except Exception as e:
             last_exception = e
 
-            if attempt < config.max_retries:
-                delay = config.retry_delay * (config.retry_exponential_base ** (attempt - 1))
-                logger.warning(
-                    "retry_attempt",
-                    attempt=attempt,
-                    max_retries=config.max_retries,
-                    delay=delay,
-                    error=str(e)
-                )
+            if attempt < max_retries:
+                delay = delays[attempt - 1]
+                # str(e) для цепочек исключений не бесплатен - только если лог включён
+                if is_log_enabled(logging.WARNING):
+                    logger.warning(
+                        "retry_attempt",
+                        attempt=attempt,
+                        max_retries=max_retries,
+                        delay=delay,
+                        error=str(e)
+                    )
                 await asyncio.sleep(delay)
-            else:
+            elif is_log_enabled(logging.ERROR):
                 logger.error(
                     "retry_exhausted",
-                    attempts=config.max_retries,
+                    attempts=max_retries,
                     error=str(e)
                 )
 
@@ -725,9 +989,25 @@ def format_lesson_time(start: time, end: time) -> str:
     Returns:
         Строка вида "09:00-10:35"
     """
+    text = _LESSON_TIME_STRINGS_BY_TIMES.get((start, end))
+    if text is not None:
+        return text
     return f"{start.strftime('%H:%M')}-{end.strftime('%H:%M')}"
 
 
+def format_lesson_time_by_number(lesson_number: int) -> Optional[str]:
+    """
+    Форматирует время пары по её номеру.
+
+    Args:
+        lesson_number: Номер пары (1-6)
+
+    Returns:
+        Строка вида "09:00-10:35" или None для неизвестного номера
+    """
+    return _LESSON_TIME_STRINGS.get(lesson_number)
+
+
 def format_day_name(day_of_week: int, full: bool = False) -> str:
     """
     Форматирует номер дня недели в название.
@@ -739,28 +1019,9 @@ def format_day_name(day_of_week: int, full: bool = False) -> str:
     Returns:
         Название дня недели
     """
-    day_names_full = {
-        1: "Понедельник",
-        2: "Вторник",
-        3: "Среда",
-        4: "Четверг",
-        5: "Пятница",
-        6: "Суббота",
-        7: "Воскресенье",
-    }
-
-    day_names_short = {
-        1: "Пнд",
-        2: "Втр",
-        3: "Срд",
-        4: "Чтв",
-        5: "Птн",
-        6: "Сбт",
-        7: "Вск",
-    }
-
-    names = day_names_full if full else day_names_short
-    return names.get(day_of_week, "Неизвестно")
+    if not 1 <= day_of_week <= 7:
+        return "Неизвестно"
+    return DAY_NAMES_FULL[day_of_week] if full else DAY_NAMES_SHORT[day_of_week]
 
 
 def validate_lesson_data(lesson_info: LessonInfo) -> tuple[bool, Optional[str]]:
@@ -782,23 +1043,60 @@ def validate_lesson_data(lesson_info: LessonInfo) -> tuple[bool, Optional[str]]:
     return True, None
 
 
-def configure_logging(log_level: str = "INFO") -> None:
+def is_log_enabled(level: int) -> bool:
+    """
+    Проверяет, будут ли выведены сообщения указанного уровня.
+
+    Позволяет не собирать тяжёлые данные для логов, которые всё равно
+    будут отброшены фильтрующим логгером.
+
+    Args:
+        level: Уровень логирования (logging.DEBUG, logging.INFO, ...)
+
+    Returns:
+        True, если сообщения этого уровня выводятся
+    """
+    return level >= _log_level
+
+
+def configure_logging(log_level: str = "INFO", renderer: str = "console") -> None:
     """
     Настройка structlog для логирования.
 
     Args:
         log_level: Уровень логирования
+        renderer: Формат вывода: "console" (цветной текст), "json" (через orjson)
+            или "auto" - json, если stdout не терминал
     """
+    global _log_level
+    _log_level = getattr(logging, log_level.upper(), logging.INFO)
+
+    if renderer == "auto":
+        renderer = "console" if sys.stdout.isatty() else "json"
+
+    final_processors: list[structlog.typing.Processor]
+    logger_factory: Callable[..., Any]
+    if renderer == "json":
+        import orjson
+
+        # orjson не умеет сериализовать exc_info - превращаем его в строку
+        final_processors = [
+            structlog.processors.format_exc_info,
+            structlog.processors.JSONRenderer(serializer=orjson.dumps)
+        ]
+        logger_factory = structlog.BytesLoggerFactory()
+    else:
+        final_processors = [structlog.dev.ConsoleRenderer()]
+        logger_factory = structlog.PrintLoggerFactory()
+
     structlog.configure(
         processors=[
             structlog.contextvars.merge_contextvars,
             structlog.processors.add_log_level,
             structlog.processors.TimeStamper(fmt="iso"),
-            structlog.dev.ConsoleRenderer()
+            *final_processors
         ],
-        wrapper_class=structlog.make_filtering_bound_logger(
-            getattr(logging, log_level.upper(), logging.INFO)
-        ),
+        wrapper_class=structlog.make_filtering_bound_logger(_log_level),
         context_class=dict,
-        logger_factory=structlog.PrintLoggerFactory(),
-    )
\ No newline at end of file
+        logger_factory=logger_factory,
+    )
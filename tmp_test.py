@@ -1,4 +1,8 @@
+import sys
+from operator import attrgetter
+
 from schedule_parser.parser import parse_schedule_html
+from schedule_parser.utils import parse_lesson_info_with_subgroups
 
 HTML = """
 
@@ -286,37 +290,80 @@ HTML = """
 
 """
 
-even, odd = parse_schedule_html(HTML, group_id=1)
+# Атрибуты урока, попадающие в запись, читаются одним вызовом
+RECORD_GETTER = attrgetter(
+    "group_id",
+    "name",
+    "lesson_date",
+    "day_of_week",
+    "lesson_number",
+    "start_time",
+    "end_time",
+    "teacher_name",
+    "cabinet_number",
+    "week_type",
+    "lesson_type",
+    "subgroup",
+    "raw_text",
+)
+# Уроки сортируются до построения записей, по (week_type, day_of_week, lesson_number)
+LESSON_SORT_KEY = attrgetter("week_type.value", "day_of_week", "lesson_number")
 
 
 def lesson_to_record(lesson):
-    name = lesson.name
-    if lesson.lesson_type:
-        name = f"{lesson.lesson_type}. {lesson.name}"
+    (
+        group_id, name, lesson_date, day_of_week, lesson_number, start_time, end_time,
+        teacher_name, cabinet_number, week_type, lesson_type, subgroup, raw_text,
+    ) = RECORD_GETTER(lesson)
+    if lesson_type:
+        name = f"{lesson_type}. {name}"
 
     return {
-        "group_id": lesson.group_id,
+        "group_id": group_id,
         "name": name,
-        "lesson_date": lesson.lesson_date.isoformat(),
-        "day_of_week": lesson.day_of_week,
-        "lesson_number": lesson.lesson_number,
-        "start_time": lesson.start_time.isoformat(timespec="minutes"),
-        "end_time": lesson.end_time.isoformat(timespec="minutes"),
-        "teacher_name": lesson.teacher_name,
-        "cabinet_number": lesson.cabinet_number,
-        "week_type": lesson.week_type.value,
-        "lesson_type": lesson.lesson_type,  # Добавлено поле
-        "subgroup": lesson.subgroup,  # Добавлено поле
-        "raw_text": lesson.raw_text,
+        "lesson_date": lesson_date.isoformat(),
+        "day_of_week": day_of_week,
+        "lesson_number": lesson_number,
+        "start_time": start_time.isoformat(timespec="minutes"),
+        "end_time": end_time.isoformat(timespec="minutes"),
+        "teacher_name": teacher_name,
+        "cabinet_number": cabinet_number,
+        "week_type": week_type.value,
+        "lesson_type": lesson_type,  # Добавлено поле
+        "subgroup": subgroup,  # Добавлено поле
+        "raw_text": raw_text,
     }
 
 
 def dump_records(title, lessons):
-    print(f"\n{title}: {len(lessons)} записей")
-    for record in sorted((lesson_to_record(lesson) for lesson in lessons),
-                         key=lambda item: (item["week_type"], item["day_of_week"], item["lesson_number"])):
-        print(record)
+    lines = [f"\n{title}: {len(lessons)} записей"]
+    lines.extend(
+        repr(record)
+        for record in map(lesson_to_record, sorted(lessons, key=LESSON_SORT_KEY))
+    )
+    # Один вызов write вместо print на каждую запись
+    sys.stdout.write("\n".join(lines) + "\n")
+
+
+# Ячейки, на которых разбор уже ломался: текст -> (преподаватели, аудитории)
+REGRESSION_CELLS = {
+    # ФИО прилипло к аудитории без пробела
+    "лек.Физика а.8240ИВАНОВ И.И.": (("ИВАНОВ И.И.",), ("а.8240",)),
+}
+
+
+def check_regressions():
+    for raw_text, expected in REGRESSION_CELLS.items():
+        actual = [(info.teachers, info.cabinets) for info in parse_lesson_info_with_subgroups(raw_text)]
+        assert actual == [expected], f"{raw_text!r}: {actual}"
+
+
+def main():
+    check_regressions()
+    even, odd = parse_schedule_html(HTML, group_id=1)
+    dump_records("Четная неделя", even)
+    dump_records("Нечетная неделя", odd)
 
 
-dump_records("Четная неделя", even)
-dump_records("Нечетная неделя", odd)
+if __name__ == "__main__":
+    main()